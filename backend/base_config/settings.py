@@ -97,6 +97,8 @@ if env.bool('MYSQL', default=False):
             'PASSWORD': env('DB_PASSWORD'),
             'HOST': env('DB_HOST'),
             'PORT': env('DB_PORT'),
+            'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+            'CONN_HEALTH_CHECKS': True,
         },
     }
 else:
@@ -107,6 +109,20 @@ else:
         },
     }
 
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+SHARED_CACHE = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+PASSWORD_HASHERS = [
+    'booking_project.users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -151,11 +167,16 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'booking_project.authentication.CachedJWTAuthentication' if SHARED_CACHE
+        else 'rest_framework_simplejwt.authentication.JWTAuthentication',
     ],
     'DEFAULT_FILTER_BACKENDS': [
-        'django_filters.rest_framework.DjangoFilterBackend',
-    ]
+        'booking_project.filters.LazyFilterBackend',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '5/min',
+        'registration': '20/hour',
+    }
 
 }
 
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking_info', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookingdetails',
+            index=models.Index(fields=['user', 'is_active'], name='booking_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingdetails',
+            index=models.Index(fields=['placement', 'is_active'], name='booking_placement_active_idx'),
+        ),
+    ]
@@ -22,3 +22,7 @@ class BookingDetails(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_active'], name='booking_user_active_idx'),
+            models.Index(fields=['placement', 'is_active'], name='booking_placement_active_idx'),
+        ]
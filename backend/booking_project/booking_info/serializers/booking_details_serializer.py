@@ -44,7 +44,6 @@ class BookingDetailSerializer(serializers.ModelSerializer):
         user = validated_data.pop('user')
 
         booking = BookingDetails.objects.create(user=user, **validated_data)
-        booking.save()
 
         return booking
 
@@ -2,38 +2,34 @@ from rest_framework.generics import UpdateAPIView, ListCreateAPIView, ListAPIVie
 from rest_framework.permissions import IsAuthenticated
 
 from booking_project.booking_info.serializers.booking_details_serializer import *
+from booking_project.pagination import BoundedPagination
 from booking_project.permissions import IsOwnerBookingPlacement, IsLandLord, IsOwnerBooking
-from booking_project.placement.models.placement import Placement
 
 
 class BookingDetailsOwnerList(ListAPIView):
     permission_classes = [IsLandLord, IsAuthenticated]
     serializer_class = BookingDetailSerializer
+    pagination_class = BoundedPagination
 
     def get_queryset(self):
         user = self.request.user
-        placements = Placement.objects.filter(owner=user, is_active=True)
-        if not placements:
-            return []
-
-        return BookingDetails.objects.filter(placement__in=placements, is_active=True)
+        return BookingDetails.objects.filter(placement__owner=user, placement__is_active=True, is_active=True)
 
 
 class BookingDetailsUserListCreate(ListCreateAPIView):
     permission_classes = [IsOwnerBooking, IsAuthenticated]
     serializer_class = BookingDetailSerializer
+    pagination_class = BoundedPagination
 
     def get_queryset(self):
-        if self.request.method == 'GET':
-            user = self.request.user
-            return BookingDetails.objects.filter(user=user, is_active=True)
-        else:
-            return BookingDetails.objects.all()
+        user = self.request.user
+        return BookingDetails.objects.filter(user=user, is_active=True)
 
 
 class InactiveBookingDetailsUserCreate(ListAPIView):
     permission_classes = [IsOwnerBooking, IsAuthenticated]
     serializer_class = BookingDetailSerializer
+    pagination_class = BoundedPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -43,20 +39,17 @@ class InactiveBookingDetailsUserCreate(ListAPIView):
 class InactiveBookingDetailsOwnerCreate(ListAPIView):
     permission_classes = [IsOwnerBookingPlacement, IsLandLord, IsAuthenticated]
     serializer_class = BookingDetailSerializer
+    pagination_class = BoundedPagination
 
     def get_queryset(self):
         user = self.request.user
-        placements = Placement.objects.filter(owner=user, is_active=True)
-        if not placements:
-            return []
-
-        return BookingDetails.objects.filter(placement__in=placements, is_active=False)
+        return BookingDetails.objects.filter(placement__owner=user, placement__is_active=True, is_active=False)
 
 
 class BookingDetailsOwnerUpdateView(UpdateAPIView):
     permission_classes = [IsOwnerBookingPlacement, IsLandLord, IsAuthenticated]
     serializer_class = BookingDetailsOwnerSerializer
-    queryset = BookingDetails.objects.all()
+    queryset = BookingDetails.objects.select_related('placement')
     lookup_field = 'pk'
 
 
@@ -0,0 +1,14 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyFilterBackend(DjangoFilterBackend):
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return queryset
+
+        if not any(param.startswith(name) for param in request.query_params
+                   for name in filterset_class.base_filters):
+            return queryset
+
+        return super().filter_queryset(request, queryset, view)
@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
+
+from django.utils.cache import patch_cache_control
 from django.utils.deprecation import MiddlewareMixin
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 from rest_framework_simplejwt.exceptions import TokenError
@@ -11,43 +13,43 @@ class JWTAuthenticationMiddleware(MiddlewareMixin):
 
         if access_token:
             try:
-                token = AccessToken(access_token)
-                if datetime.fromtimestamp(token['exp']) < datetime.now():
-                    raise TokenError('Token is expired')
+                AccessToken(access_token)
                 request.META['HTTP_AUTHORIZATION'] = f"Bearer {access_token}"
             except TokenError:
                 new_access_token = self.refresh_access_token(refresh_token)
                 if new_access_token:
-                    request.META['HTTP_AUTHORIZATION'] = f'Bearer {new_access_token}'
-                    request._new_access_token = new_access_token
+                    self.set_new_access_token(request, new_access_token)
                 else:
                     self.clear_cookies(request)
         elif refresh_token:
             new_access_token = self.refresh_access_token(refresh_token)
             if new_access_token:
-                request.META['HTTP_AUTHORIZATION'] = f'Bearer {new_access_token}'
-                request._new_access_token = new_access_token
+                self.set_new_access_token(request, new_access_token)
             else:
                 self.clear_cookies(request)
 
     def refresh_access_token(self, refresh_token):
         try:
             refresh = RefreshToken(refresh_token)
-            new_access_token = str(refresh.access_token)
-            return new_access_token
+            return refresh.access_token
         except TokenError:
             return None
 
+    def set_new_access_token(self, request, access_token):
+        request._new_access_token = str(access_token)
+        request._new_access_token_exp = datetime.fromtimestamp(access_token['exp'], tz=timezone.utc)
+        request.META['HTTP_AUTHORIZATION'] = f'Bearer {request._new_access_token}'
+
     def process_response(self, request, response):
         new_access_token = getattr(request, '_new_access_token', None)
         if new_access_token:
-            access_expiry = AccessToken(new_access_token)['exp']
             response.set_cookie(
                 'access_token',
                 new_access_token,
-                expires=access_expiry,
+                expires=request._new_access_token_exp,
                 httponly=True
             )
+            patch_cache_control(response, private=True)
         return response
 
     def clear_cookies(self, request):
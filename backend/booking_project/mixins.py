@@ -0,0 +1,11 @@
+from django.utils.cache import patch_cache_control
+
+
+class PublicJSONCacheMixin:
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        renderer = getattr(request, 'accepted_renderer', None)
+        if response.has_header('Cache-Control') and (
+                request.user.is_authenticated or renderer is None or renderer.format != 'json'):
+            patch_cache_control(response, private=True)
+        return response
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class PlacementCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = '-id'
+
+
+class BoundedPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
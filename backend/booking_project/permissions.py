@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 
-SAFE_METHODS = ['GET', 'HEAD', 'OPTIONS']
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
 
 
 class IsOwnerUser(BasePermission):
@@ -31,14 +31,14 @@ class IsOwnerPlacement(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        return obj.owner == request.user
+        return obj.owner_id == request.user.pk
 
 
 class IsOwnerPlacementDetails(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        return obj.placement.owner == request.user
+        return obj.placement.owner_id == request.user.pk
 
 
 class IsOwnerBookingPlacement(BasePermission):
@@ -46,7 +46,7 @@ class IsOwnerBookingPlacement(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return obj.placement.owner == request.user
+        return obj.placement.owner_id == request.user.pk
 
 
 class IsOwnerBooking(BasePermission):
@@ -54,7 +54,7 @@ class IsOwnerBooking(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return obj.user == request.user
+        return obj.user_id == request.user.pk
 
 
 class IsOwnerReview(BasePermission):
@@ -63,4 +63,4 @@ class IsOwnerReview(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return obj.author == request.user
+        return obj.author_id == request.user.pk
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlacementModelsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'booking_project.placement'
+
+    def ready(self):
+        from booking_project.placement import signals  # noqa: F401
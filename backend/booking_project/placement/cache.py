@@ -0,0 +1,41 @@
+import hashlib
+import time
+from functools import lru_cache
+
+from django.core.cache import cache
+
+from booking_project.placement.models.categories import Categories
+
+CATEGORIES_VERSION_KEY = 'reference:categories:version'
+CATEGORIES_LOCAL_TTL = 60
+
+
+def categories_version():
+    return cache.get_or_set(CATEGORIES_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def _local_bucket():
+    return int(time.monotonic() // CATEGORIES_LOCAL_TTL)
+
+
+@lru_cache(maxsize=16)
+def _categories_data(version, bucket):
+    data = list(Categories.objects.values('id', 'name'))
+    etag = hashlib.sha256(repr(data).encode()).hexdigest()
+    return data, etag
+
+
+def _categories():
+    return _categories_data(categories_version(), _local_bucket())
+
+
+def categories_etag(request, *args, **kwargs):
+    return f'{_categories()[1]}:{request.accepted_renderer.format}'
+
+
+def get_cached_categories():
+    return _categories()[0]
+
+
+def invalidate_categories():
+    cache.set(CATEGORIES_VERSION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='placement',
+            index=models.Index(fields=['is_active', '-id'], name='placement_active_id_idx'),
+        ),
+    ]
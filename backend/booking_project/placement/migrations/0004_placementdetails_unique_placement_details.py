@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0003_placement_placement_active_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='placementdetails',
+            constraint=models.UniqueConstraint(fields=('placement',), name='unique_placement_details'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0004_placementdetails_unique_placement_details'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='location',
+            constraint=models.UniqueConstraint(fields=('placement',), name='unique_placement_location'),
+        ),
+    ]
@@ -18,3 +18,8 @@ class Location(models.Model):
     updated_at = models.DateField(auto_now=True, verbose_name="Date created")
     # latitude
     # longitude
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['placement'], name='unique_placement_location')
+        ]
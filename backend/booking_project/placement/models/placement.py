@@ -37,6 +37,9 @@ class Placement(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', '-id'], name='placement_active_id_idx'),
+        ]
         constraints = [
             models.CheckConstraint(
                 condition=Q(single_bed__isnull=False) | Q(double_bed__isnull=False),
@@ -23,3 +23,8 @@ class PlacementDetails(models.Model):
 
     created_at = models.DateField(auto_now_add=True, verbose_name="Date created")
     updated_at = models.DateField(auto_now=True, verbose_name="Date updated")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['placement'], name='unique_placement_details')
+        ]
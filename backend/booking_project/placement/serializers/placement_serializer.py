@@ -1,18 +1,13 @@
-from django.db.models import Avg
 from rest_framework import serializers
 
 from booking_project.placement.models.location import Location
 from booking_project.placement.models.placement import Placement
 from booking_project.placement.models.placement_details import PlacementDetails
-from booking_project.reviews.models.review import Review
+from booking_project.serializers import CachedFieldsMixin
 
 
 class PlacementDetailSerializer(serializers.ModelSerializer):
-    rating = serializers.SerializerMethodField('avg_rating')
-
-    def avg_rating(self, obj):
-        count = Review.objects.filter(placement=obj.pk).aggregate(Avg('rating'))
-        return count['rating__avg'] if count['rating__avg'] else 0
+    rating = serializers.FloatField(source='rating_avg', read_only=True)
 
     class Meta:
         model = PlacementDetails
@@ -28,11 +23,7 @@ class LocationSerializer(serializers.ModelSerializer):
 
 
 class PlacementSerializer(serializers.ModelSerializer):
-    rating = serializers.SerializerMethodField('avg_rating')
-
-    def avg_rating(self, obj):
-        count = Review.objects.filter(placement=obj).aggregate(Avg('rating'))
-        return count['rating__avg'] if count['rating__avg'] else 0
+    rating = serializers.FloatField(source='rating_avg', read_only=True)
 
     class Meta:
         model = Placement
@@ -55,7 +46,6 @@ class FullPlacementSerializer(serializers.ModelSerializer):
         location = validated_data.pop('placement_location', None)
 
         placement = Placement.objects.create(**validated_data)
-        placement.save()
 
         if details_field:
             PlacementDetails.objects.create(placement=placement, **details_field)
@@ -65,17 +55,9 @@ class FullPlacementSerializer(serializers.ModelSerializer):
         return placement
 
 
-class PlacementBaseDetailSerializer(serializers.ModelSerializer):
-    rating = serializers.SerializerMethodField('avg_rating')
-    city = serializers.SerializerMethodField('get_city')
-
-    def get_city(self, obj):
-        city = Location.objects.get(placement=obj.pk)
-        return city.city
-
-    def avg_rating(self, obj):
-        count = Review.objects.filter(placement=obj).aggregate(Avg('rating'))
-        return count['rating__avg'] if count['rating__avg'] else 0
+class PlacementBaseDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    rating = serializers.FloatField(source='rating_avg', read_only=True)
+    city = serializers.CharField(source='location_city', read_only=True)
 
     class Meta:
         model = Placement
@@ -0,0 +1,11 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from booking_project.placement.cache import invalidate_categories
+from booking_project.placement.models.categories import Categories
+
+
+@receiver([post_save, post_delete], sender=Categories)
+def categories_changed(sender, **kwargs):
+    transaction.on_commit(invalidate_categories)
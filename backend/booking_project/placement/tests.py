@@ -1,3 +1,112 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from booking_project.booking_info.models.booking_details import BookingDetails
+from booking_project.placement.models.categories import Categories
+from booking_project.placement.models.location import Location
+from booking_project.placement.models.placement import Placement
+from booking_project.placement.models.placement_details import PlacementDetails
+from booking_project.reviews.models.review import Review
+from booking_project.users.models import User
+
+
+class PlacementQueryTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email='owner@example.com',
+            password='Str0ng-passw0rd',
+            first_name='Owner',
+            last_name='User',
+            is_landlord=True,
+        )
+        cls.guest = User.objects.create_user(
+            email='guest@example.com',
+            password='Str0ng-passw0rd',
+            first_name='Guest',
+            last_name='User',
+        )
+        cls.category = Categories.objects.create(name='Apartment')
+
+        cls.rated = cls.create_placement('Rated flat')
+        Location.objects.create(placement=cls.rated, country='Germany', city='Berlin', post_code='10115',
+                                street='Invalidenstrasse', house_number='1')
+        for rating in (4, 2):
+            booking = BookingDetails.objects.create(placement=cls.rated, user=cls.guest,
+                                                    start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+            Review.objects.create(booking=booking, author=cls.guest, placement=cls.rated,
+                                  feedback='Quiet and clean flat.', rating=rating)
+
+        cls.unrated = cls.create_placement('Unrated flat')
+
+    @classmethod
+    def create_placement(cls, title, **kwargs):
+        return Placement.objects.create(
+            owner=cls.owner,
+            category=cls.category,
+            title=title,
+            description='A bright flat close to the station with everything needed.',
+            price='80.00',
+            **kwargs
+        )
+
+
+class PlacementListViewTests(PlacementQueryTestMixin, APITestCase):
+    def test_list_page_is_a_single_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('placement-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+
+    def test_list_query_skips_excluded_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('placement-list'))
+
+        self.assertNotIn('is_deleted', queries[0]['sql'])
+        self.assertNotIn('owner_id', queries[0]['sql'])
+
+    def test_list_reports_city_and_rating(self):
+        response = self.client.get(reverse('placement-list'))
+        results = {item['id']: item for item in response.data['results']}
+
+        self.assertEqual(results[self.rated.pk]['city'], 'Berlin')
+        self.assertEqual(results[self.rated.pk]['rating'], 3.0)
+        self.assertIsNone(results[self.unrated.pk]['city'])
+        self.assertEqual(results[self.unrated.pk]['rating'], 0.0)
+
+
+class InactivePlacementListViewTests(PlacementQueryTestMixin, APITestCase):
+    def test_inactive_list_counts_and_fetches_in_two_queries(self):
+        inactive = self.create_placement('Inactive flat', is_active=False)
+        self.client.force_authenticate(self.owner)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('placement-inactive'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [inactive.pk])
+
+
+class PlacementDetailViewTests(PlacementQueryTestMixin, APITestCase):
+    def test_placement_detail_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('placement', kwargs={'pk': self.rated.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rating'], 3.0)
+
+    def test_placement_details_is_a_single_query(self):
+        PlacementDetails.objects.create(placement=self.rated, free_wifi=True)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('placement-details', kwargs={'placement': self.rated.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rating'], 3.0)
+        self.assertTrue(response.data['free_wifi'])
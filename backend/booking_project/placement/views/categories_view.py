@@ -1,13 +1,24 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework.generics import ListCreateAPIView, ListAPIView
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 
+from booking_project.mixins import PublicJSONCacheMixin
+from booking_project.placement.cache import CATEGORIES_LOCAL_TTL, categories_etag, get_cached_categories
 from booking_project.placement.models.categories import Categories
 from booking_project.placement.serializers.categories_serializer import CategoriesSerializer
 
 
-class CategoryCreateListView(ListCreateAPIView):
+class CategoryCreateListView(PublicJSONCacheMixin, ListCreateAPIView):
     # permission_classes = [IsAdminUser, IsAuthenticatedOrReadOnly]
     permission_classes = [AllowAny]
 
     queryset = Categories.objects.all()
     serializer_class = CategoriesSerializer
+
+    @method_decorator(cache_control(public=True, max_age=CATEGORIES_LOCAL_TTL))
+    @method_decorator(condition(etag_func=categories_etag))
+    def list(self, request, *args, **kwargs):
+        return Response(get_cached_categories())
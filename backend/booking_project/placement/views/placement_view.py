@@ -1,10 +1,21 @@
+from django.db.models import Avg, Exists, OuterRef, Subquery
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.generics import CreateAPIView, RetrieveUpdateDestroyAPIView, ListAPIView, RetrieveUpdateAPIView
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
-from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.renderers import BrowsableAPIRenderer
 
+from booking_project.filters import LazyFilterBackend
+from booking_project.mixins import PublicJSONCacheMixin
+from booking_project.pagination import BoundedPagination, PlacementCursorPagination
 from booking_project.permissions import *
 from booking_project.placement.serializers.placement_serializer import *
+from booking_project.renderers import ORJSONRenderer
+
+LOCATION_CITY = Subquery(Location.objects.filter(placement=OuterRef('pk')).order_by('id').values('city')[:1])
+RATING_AVG = Avg('placement_review__rating', default=0)
+PLACEMENT_LIST_DEFERRED = tuple(PlacementBaseDetailSerializer.Meta.exclude)
 
 
 class PlacementCreateView(CreateAPIView):
@@ -15,54 +26,69 @@ class PlacementCreateView(CreateAPIView):
 
 class InactivePlacementListView(ListAPIView):
     permission_classes = [IsOwnerPlacement, IsAuthenticated]
-    queryset = Placement.objects.filter(is_active=False)
     serializer_class = PlacementBaseDetailSerializer
+    pagination_class = BoundedPagination
+
+    def get_queryset(self):
+        user = self.request.user
+        return Placement.objects.filter(owner=user, is_active=False).defer(*PLACEMENT_LIST_DEFERRED).annotate(
+            rating_avg=RATING_AVG, location_city=LOCATION_CITY)
 
 
 class InactivePlacementRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
     permission_classes = [IsOwnerPlacement, IsAuthenticatedOrReadOnly]
-    queryset = Placement.objects.all()
+    queryset = Placement.objects.annotate(rating_avg=RATING_AVG)
     serializer_class = PlacementSerializer
     lookup_field = 'pk'
 
 
-class PlacementListView(ListAPIView):
+@method_decorator(cache_control(public=True, max_age=60), name='get')
+class PlacementListView(PublicJSONCacheMixin, ListAPIView):
     permission_classes = [AllowAny]
+    http_method_names = ['get', 'head']
+    queryset = Placement.objects.filter(is_active=True).defer(*PLACEMENT_LIST_DEFERRED).annotate(
+        rating_avg=RATING_AVG, location_city=LOCATION_CITY)
     serializer_class = PlacementBaseDetailSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = PlacementCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    filter_backends = [LazyFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = {
         'category__name': ['exact'],
         'price': ['gte', 'lte'],
         'number_of_rooms': ['gte', 'lte']
     }
     search_fields = ['title', 'description']
+    # Cursors stay keyset-based only for the default '-id' ordering; ?ordering=price/created_at
+    # are not unique, so DRF falls back to offsets among rows sharing a value.
     ordering_fields = ['price', 'created_at']
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         params = self.request.query_params.get('city')
 
         if params:
-            return Placement.objects.filter(placement_location__city=params, is_active=True)
-        else:
-            return Placement.objects.filter(is_active=True)
+            return queryset.filter(Exists(Location.objects.filter(placement=OuterRef('pk'), city=params)))
+        return queryset
 
 
 class PlacementRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
     permission_classes = [IsOwnerPlacement, IsAuthenticatedOrReadOnly]
-    queryset = Placement.objects.all()
+    queryset = Placement.objects.annotate(rating_avg=RATING_AVG)
     serializer_class = PlacementSerializer
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     lookup_field = 'pk'
 
 
 class PlacementDetailsRetrieveUpdateDestroyView(RetrieveUpdateAPIView):
     permission_classes = [IsOwnerPlacementDetails, IsAuthenticatedOrReadOnly]
-    queryset = PlacementDetails.objects.all()
+    queryset = PlacementDetails.objects.select_related('placement').annotate(
+        rating_avg=Avg('placement__placement_review__rating', default=0))
     serializer_class = PlacementDetailSerializer
     lookup_field = 'placement'
 
 
 class LocationRetrieveUpdateDestroyView(RetrieveUpdateAPIView):
     permission_classes = [IsOwnerPlacementDetails, IsAuthenticatedOrReadOnly]
-    queryset = Location.objects.all()
+    queryset = Location.objects.select_related('placement')
     serializer_class = LocationSerializer
     lookup_field = 'placement'
@@ -21,14 +21,10 @@ class RatingSerializer(serializers.ModelSerializer):
         if booking_date.start_date > datetime.today().date():
             raise serializers.ValidationError("You can't write review for apartments you have in future")
 
-        booking_date = Review.objects.filter(author=author, booking=booking_date)
-
-        if booking_date:
+        if Review.objects.filter(author=author, booking=booking_date).exists():
             raise serializers.ValidationError("You have already left a comment for this reservation.")
 
-        booking = BookingDetails.objects.filter(user=author, placement=placement)
-
-        if not booking:
+        if not BookingDetails.objects.filter(user=author, placement=placement).exists():
             raise serializers.ValidationError("You can't write review for apartments you didn't booked")
 
         if author == data.get('placement').owner:
@@ -40,7 +36,6 @@ class RatingSerializer(serializers.ModelSerializer):
         author = validated_data.pop('author')
 
         review = Review.objects.create(author=author, **validated_data)
-        review.save()
 
         return review
 
@@ -51,3 +46,11 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['created_at', 'updated_at', 'author', 'placement', 'rating']
         extra_kwargs = {'feedback': {'required': True}}
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+
+        return instance
@@ -1,7 +1,10 @@
 from rest_framework.generics import ListAPIView, CreateAPIView, UpdateAPIView, DestroyAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 
+from booking_project.pagination import BoundedPagination
 from booking_project.permissions import IsOwnerReview
+from booking_project.renderers import ORJSONRenderer
 from booking_project.reviews.serializers.review_serializer import *
 
 
@@ -15,6 +18,8 @@ class ReviewListView(ListAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
     queryset = Review.objects.all()
     serializer_class = RatingSerializer
+    pagination_class = BoundedPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     lookup_field = 'pk'
 
 
@@ -0,0 +1,11 @@
+import copy
+
+
+class CachedFieldsMixin:
+    _fields_template = None
+
+    def get_fields(self):
+        cls = type(self)
+        if cls.__dict__.get('_fields_template') is None:
+            cls._fields_template = super().get_fields()
+        return copy.deepcopy(cls._fields_template)
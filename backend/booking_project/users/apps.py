@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'booking_project.users'
+
+    def ready(self):
+        from booking_project.users import signals  # noqa: F401
@@ -0,0 +1,50 @@
+from django.core.cache import cache
+
+from booking_project.users.models import User
+
+USER_CACHE_TIMEOUT = 60
+USER_DATA_TIMEOUT = 60 * 5
+
+
+def user_cache_key(user_id):
+    return f'user:{user_id}:auth'
+
+
+def get_cached_user(user_id, load):
+    key = user_cache_key(user_id)
+    user = cache.get(key)
+    if user is not None:
+        user._from_auth_cache = True
+        return user
+
+    user = load()
+    if user is not None:
+        cache.set(key, user, timeout=USER_CACHE_TIMEOUT)
+    return user
+
+
+def get_fresh_user(request):
+    # Only a user served from the auth cache can be stale; re-read it once per request.
+    if not getattr(request.user, '_from_auth_cache', False):
+        return request.user
+    if not hasattr(request, '_fresh_user'):
+        request._fresh_user = User.objects.get(pk=request.user.pk)
+    return request._fresh_user
+
+
+def get_cached_user_data(user, serializer_class):
+    key = f'user_ser:{serializer_class.__name__}:{user.pk}:{user.updated_at.timestamp()}'
+    return cache.get_or_set(key, lambda: dict(serializer_class(user).data), timeout=USER_DATA_TIMEOUT)
+
+
+def user_etag(request, *args, **kwargs):
+    user = get_fresh_user(request)
+    return f'{user.pk}:{user.updated_at.timestamp()}'
+
+
+def user_last_modified(request, *args, **kwargs):
+    return get_fresh_user(request).updated_at
+
+
+def invalidate_user(user_id):
+    cache.delete(user_cache_key(user_id))
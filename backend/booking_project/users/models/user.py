@@ -47,4 +47,4 @@ class User(AbstractUser):
 
     def delete(self, *args, **kwargs):
         self.is_deleted = True
-        self.save()
+        self.save(update_fields=['is_deleted', 'updated_at'])
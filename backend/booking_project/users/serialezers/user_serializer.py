@@ -4,10 +4,13 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from booking_project.serializers import CachedFieldsMixin
 from ..models.user import User
 
+NAME_PATTERN = re.compile('^[a-zA-Z]*$')
 
-class UserRegisterSerializer(serializers.ModelSerializer):
+
+class UserRegisterSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     confirm_password = serializers.CharField(max_length=128, write_only=True)
 
     class Meta:
@@ -21,12 +24,12 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         password = data.get("password")
         confirm_password = data.get("confirm_password")
 
-        if not re.match('^[a-zA-Z]*$', first_name):
+        if not NAME_PATTERN.match(first_name):
             raise serializers.ValidationError(
                 "The first name must contain only alphabet symbols"
             )
 
-        if not re.match('^[a-zA-Z]*$', last_name):
+        if not NAME_PATTERN.match(last_name):
             raise serializers.ValidationError(
                 "The last name must contain only alphabet symbols"
             )
@@ -50,7 +53,7 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserBaseDetailSerializer(serializers.ModelSerializer):
+class UserBaseDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'first_name', 'last_name', 'username', 'email', 'password']
@@ -58,7 +61,7 @@ class UserBaseDetailSerializer(serializers.ModelSerializer):
         extra_kwargs = {'password': {'write_only': True}}
 
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         exclude = ['last_login', 'password', 'is_superuser', 'is_staff', 'user_permissions', 'groups', 'is_deleted']
@@ -1,6 +1,8 @@
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import RefreshToken
 
+JWT_COOKIES = ('access_token', 'refresh_token')
+
 
 def set_jwt_cookies(response, user):
     refresh_token = RefreshToken.for_user(user)
@@ -32,3 +34,10 @@ def set_jwt_cookies(response, user):
     )
 
     return response
+
+
+def delete_jwt_cookies(response):
+    for name in JWT_COOKIES:
+        response.delete_cookie(name)
+
+    return response
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from booking_project.users.cache import invalidate_user
+from booking_project.users.models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user(user_id))
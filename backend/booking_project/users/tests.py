@@ -1,3 +1,166 @@
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from booking_project.authentication import CachedJWTAuthentication
+from booking_project.users.cache import user_cache_key
+from booking_project.users.models import User
+from booking_project.users.views.user_views import UserDetailsUpdateDeleteView
+
+
+class SharedCacheTestMixin:
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        shared_cache = self.settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir.name,
+            },
+        })
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        super().setUp()
+
+
+class UserDetailsUpdateDeleteViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('user-detail')
+        self.user = User.objects.create_user(
+            email='guest@example.com',
+            password='Str0ng-passw0rd',
+            first_name='Guest',
+            last_name='User',
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+    def test_get_reads_the_user_once(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_after_patch_returns_updated_details(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Guest')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, {'first_name': 'Updated'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Updated')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Updated')
+
+    def test_patch_invalidates_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(self.url, {'last_name': 'Changed'}, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['last_name'], 'Changed')
+
+    def test_delete_soft_deletes_user_and_clears_cookies(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_deleted)
+
+        for name in ('access_token', 'refresh_token'):
+            self.assertEqual(response.cookies[name].value, '')
+            self.assertEqual(response.cookies[name]['max-age'], 0)
+
+
+class CachedUserDetailsUpdateDeleteViewTests(SharedCacheTestMixin, UserDetailsUpdateDeleteViewTests):
+    def setUp(self):
+        super().setUp()
+        authentication = mock.patch.object(UserDetailsUpdateDeleteView, 'authentication_classes',
+                                           (CachedJWTAuthentication,))
+        authentication.start()
+        self.addCleanup(authentication.stop)
+
+    def test_patch_keeps_changes_made_behind_the_cache(self):
+        self.client.get(self.url)
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+
+        User.objects.filter(pk=self.user.pk).update(first_name='Elsewhere')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, {'last_name': 'Changed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Elsewhere')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Elsewhere')
+        self.assertEqual(self.user.last_name, 'Changed')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['first_name'], 'Elsewhere')
+        self.assertEqual(response.data['last_name'], 'Changed')
+
+
+class CachedJWTAuthenticationTests(SharedCacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.authentication = CachedJWTAuthentication()
+        self.user = User.objects.create_user(
+            email='guest@example.com',
+            password='Str0ng-passw0rd',
+            first_name='Guest',
+            last_name='User',
+        )
+        self.token = AccessToken.for_user(self.user)
+
+    def test_cached_user_skips_the_database(self):
+        self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertIn('password', user.get_deferred_fields())
+
+    def test_missing_user_is_rejected(self):
+        self.token[api_settings.USER_ID_CLAIM] = 999999
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_inactive_user_is_rejected(self):
+        self.authentication.get_user(self.token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_save_evicts_cached_user(self):
+        self.authentication.get_user(self.token)
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
 
-# Create your tests here.
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
@@ -1,19 +1,26 @@
 from django.contrib.auth import authenticate
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework import status
-from rest_framework.generics import RetrieveUpdateDestroyAPIView, CreateAPIView
+from rest_framework.generics import CreateAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
 from booking_project.permissions import *
+from ..cache import get_cached_user_data, get_fresh_user, user_etag, user_last_modified
 from ..serialezers.user_serializer import *
 
-from ..set_cookie import set_jwt_cookies
+from ..set_cookie import delete_jwt_cookies, set_jwt_cookies
 
 
 class UserCreateView(CreateAPIView):
     permission_classes = (AllowAny,)
     authentication_classes = []
+    throttle_classes = (ScopedRateThrottle,)
+    throttle_scope = 'registration'
     queryset = User.objects.all()
     serializer_class = UserRegisterSerializer
 
@@ -21,6 +28,8 @@ class UserCreateView(CreateAPIView):
 class UserLoginView(CreateAPIView):
     permission_classes = (AllowAny,)
     authentication_classes = []
+    throttle_classes = (ScopedRateThrottle,)
+    throttle_scope = 'login'
     serializer_class = UserBaseDetailSerializer
 
     def create(self, request, *args, **kwargs):
@@ -29,9 +38,8 @@ class UserLoginView(CreateAPIView):
         user = authenticate(request, username=email, password=password)
 
         if user:
-            user_data = User.objects.get(email=user)
-            serializer = self.serializer_class(user_data)
-            response = Response(serializer.data, status=status.HTTP_200_OK)
+            user_data = get_cached_user_data(user, self.serializer_class)
+            response = Response(user_data, status=status.HTTP_200_OK)
             response = set_jwt_cookies(response, user)
             return response
 
@@ -39,30 +47,41 @@ class UserLoginView(CreateAPIView):
             return Response({"detail": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
 
-class UserDetailsUpdateDeleteView(RetrieveUpdateDestroyAPIView):
-    permission_classes = (IsOwnerUser, IsAuthenticated)
+class UserDetailsUpdateDeleteView(APIView):
+    permission_classes = (IsAuthenticated,)
     serializer_class = UserDetailSerializer
 
-    def get_object(self):
-        obj = User.objects.get(email=self.request.user)
-        self.check_object_permissions(self.request, obj)
-        return obj
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=user_etag, last_modified_func=user_last_modified))
+    def get(self, request, *args, **kwargs):
+        return Response(get_cached_user_data(get_fresh_user(request), self.serializer_class))
 
-    def destroy(self, request, *args, **kwargs):
-        user = User.objects.get(email=request.user)
-        user.delete()
+    def put(self, request, *args, **kwargs):
+        return self.update(request, partial=False)
+
+    def patch(self, request, *args, **kwargs):
+        return self.update(request, partial=True)
+
+    def update(self, request, partial):
+        serializer = self.serializer_class(get_fresh_user(request), data=request.data, partial=partial,
+                                           context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+    def delete(self, request, *args, **kwargs):
+        request.user.delete()
 
         response = Response({
             "message": "User was deleted successfully"
         }, status=status.HTTP_200_OK)
-        response.delete_cookie('access_token')
-        response.delete_cookie('refresh_token')
-        return response
+        return delete_jwt_cookies(response)
 
 
 class LogoutUserView(APIView):
+    permission_classes = (AllowAny,)
+    authentication_classes = []
+
     def post(self, request, *args, **kwargs):
         response = Response(status=status.HTTP_200_OK)
-        response.delete_cookie('access_token')
-        response.delete_cookie('refresh_token')
-        return response
+        return delete_jwt_cookies(response)